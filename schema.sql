@@ -15,7 +15,9 @@ CREATE TABLE IF NOT EXISTS Items (
     dateFound TEXT NOT NULL,
     foundAt TEXT NOT NULL,
     isClaimed INTEGER DEFAULT 0,
-    dateUpdated TEXT DEFAULT (datetime('now'))
+    dateUpdated TEXT DEFAULT (datetime('now')),
+    -- Julian day of dateFound, computed once on write for day-age math
+    dateFoundJD REAL GENERATED ALWAYS AS (julianday(dateFound)) STORED
 );
 
 -- Claims Table
@@ -49,8 +51,14 @@ CREATE TABLE IF NOT EXISTS ItemStatus (
     FOREIGN KEY (itemID) REFERENCES Items(id)
 );
 
+-- Meta Table (key/value counters, e.g. employees_ver for response caching)
+CREATE TABLE IF NOT EXISTS Meta (
+    key TEXT PRIMARY KEY,
+    val INTEGER NOT NULL
+);
+
 -- ========================================
--- 2. CREATE TRIGGERS (trg_Item_BeforeUpdate)
+-- 2. CREATE TRIGGERS (trg_Item_BeforeUpdate, trg_Employees_Version*)
 -- ========================================
 
 -- Trigger: Automatically update dateUpdated when an Item is modified
@@ -61,8 +69,40 @@ BEGIN
     UPDATE Items SET dateUpdated = datetime('now') WHERE id = NEW.id;
 END;
 
+-- Triggers: Bump Meta.employees_ver whenever Employees changes
+CREATE TRIGGER IF NOT EXISTS trg_Employees_VersionInsert
+AFTER INSERT ON Employees
+BEGIN
+    INSERT INTO Meta (key, val) VALUES ('employees_ver', 1)
+    ON CONFLICT(key) DO UPDATE SET val = val + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_Employees_VersionUpdate
+AFTER UPDATE ON Employees
+BEGIN
+    INSERT INTO Meta (key, val) VALUES ('employees_ver', 1)
+    ON CONFLICT(key) DO UPDATE SET val = val + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_Employees_VersionDelete
+AFTER DELETE ON Employees
+BEGIN
+    INSERT INTO Meta (key, val) VALUES ('employees_ver', 1)
+    ON CONFLICT(key) DO UPDATE SET val = val + 1;
+END;
+
+-- ========================================
+-- 3. CREATE INDEXES
+-- ========================================
+
+-- Unclaimed items listing, keyset-paginated (WHERE isClaimed = 0 AND id < ? ORDER BY id DESC)
+CREATE INDEX IF NOT EXISTS idx_items_unclaimed_id ON Items(isClaimed, id);
+
+-- Pending claims report (WHERE verificationStatus = 'Pending')
+CREATE INDEX IF NOT EXISTS idx_claims_pending ON Claims(verificationStatus);
+
 -- ========================================
--- 3. SEED DATA
+-- 4. SEED DATA
 -- ========================================
 
 -- Seed Employees
@@ -91,7 +131,7 @@ INSERT INTO Claims (claimDate, verificationCode, ownerFirstName, ownerLastName,
     ('2025-01-13', 'VC109', 'Sanjay', 'Shetty', 6, 'Pending', NULL);
 
 -- ========================================
--- 4. SAMPLE QUERIES (documented)
+-- 5. SAMPLE QUERIES (documented)
 -- ========================================
 
 -- Query 1: Dashboard Summary (Metrics)
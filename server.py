@@ -6,11 +6,137 @@ Connects SQLite database to HTML UI via REST API
 
 import sqlite3
 import json
-from http.server import HTTPServer, BaseHTTPRequestHandler
+import re
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from urllib.parse import parse_qs, urlparse
 import os
+import queue
+import threading
+import time
+import gzip
+import zlib
+import sys
+import logging
+from logging.handlers import QueueHandler, QueueListener
+from contextlib import contextmanager
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
 
 DB_PATH = 'lostandfound.db'
+# INSERT/UPDATE ... RETURNING needs SQLite 3.35 (generated columns need 3.31)
+MIN_SQLITE_VERSION = (3, 35, 0)
+POOL_SIZE = 8
+# Seconds to wait for a free pooled connection before answering 503, and
+# the socket timeout that stops stalled clients from pinning a connection
+POOL_TIMEOUT = 5
+REQUEST_TIMEOUT = 30
+
+# Applied to every pooled connection: WAL journal, memory-mapped reads
+# (256 MiB), in-memory temp tables and a 32 MB page cache
+CONNECTION_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA mmap_size=268435456;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-32000;
+"""
+
+# Static assets served by the backend, cached in memory as
+# filepath -> (mtime, content_type, etag, content, gzipped_content)
+STATIC_FILES = ['ui.html']
+CONTENT_TYPES = {
+    '.html': 'text/html',
+    '.css': 'text/css',
+    '.js': 'application/javascript',
+}
+_STATIC = {}
+
+# Flush threshold when streaming JSON arrays to the socket, and how many
+# rows are serialized per batch
+STREAM_CHUNK_SIZE = 16384
+STREAM_BATCH_ROWS = 256
+
+# JSON responses are gzipped on the fly at a cheap level once they pass
+# GZIP_MIN_SIZE; static files are precompressed at the highest level
+GZIP_MIN_SIZE = 1024
+GZIP_LEVEL = 1
+
+# Reusable request body buffers. ThreadingHTTPServer starts a fresh thread
+# per request, so they are pooled rather than thread-local; larger bodies
+# get a one-off buffer.
+BODY_BUFFER_SIZE = 16384
+_body_buffers = queue.SimpleQueue()
+
+# /api/items page size: default and upper bound for ?limit=
+ITEMS_PAGE_SIZE = 50
+ITEMS_PAGE_MAX = 500
+
+# Largest SQLite rowid; a since_id past it means "start from the newest item"
+MAX_ROWID = 2**63 - 1
+
+# Cached /api/metrics response body (plus its gzip_json copy); bump 'gen' to invalidate. 'ts' is
+# -inf when empty: monotonic() counts from boot, so 0.0 could look fresh.
+_METRICS_TTL = 10
+_metrics_cache = {'ts': float('-inf'), 'gen': 0, 'body': b'', 'gzip': None}
+
+# Cached /api/employees response body (plus its gzip_json copy), valid while Meta.employees_ver matches
+_employees_cache = {'ver': None, 'body': b'', 'gzip': None}
+
+# CORS headers sent on every API response
+CORS_HEADERS = (
+    ('Access-Control-Allow-Origin', '*'),
+    ('Access-Control-Allow-Methods', 'GET, POST, OPTIONS'),
+    ('Access-Control-Allow-Headers', 'Content-Type'),
+)
+
+# Complete preflight response, built once; Max-Age lets browsers cache it
+_PREFLIGHT = (
+    f'{BaseHTTPRequestHandler.protocol_version} 200 OK\r\n'
+    + ''.join(f'{name}: {value}\r\n' for name, value in CORS_HEADERS)
+    + 'Access-Control-Max-Age: 86400\r\n'
+    + 'Content-Length: 0\r\n'
+    + '\r\n'
+).encode('latin-1')
+
+# Request log; records are handed to a queue and written by a background
+# thread so handlers never block on stdout
+logger = logging.getLogger('api')
+
+# Idempotent schema additions, also applied to databases created before
+# they were added to schema.sql
+SCHEMA_UPGRADES_SQL = """
+    DROP INDEX IF EXISTS idx_items_unclaimed_date;
+    CREATE INDEX IF NOT EXISTS idx_items_unclaimed_id ON Items(isClaimed, id);
+    CREATE INDEX IF NOT EXISTS idx_claims_pending ON Claims(verificationStatus);
+    
+    CREATE TABLE IF NOT EXISTS Meta (
+        key TEXT PRIMARY KEY,
+        val INTEGER NOT NULL
+    );
+    CREATE TRIGGER IF NOT EXISTS trg_Employees_VersionInsert
+    AFTER INSERT ON Employees
+    BEGIN
+        INSERT INTO Meta (key, val) VALUES ('employees_ver', 1)
+        ON CONFLICT(key) DO UPDATE SET val = val + 1;
+    END;
+    CREATE TRIGGER IF NOT EXISTS trg_Employees_VersionUpdate
+    AFTER UPDATE ON Employees
+    BEGIN
+        INSERT INTO Meta (key, val) VALUES ('employees_ver', 1)
+        ON CONFLICT(key) DO UPDATE SET val = val + 1;
+    END;
+    CREATE TRIGGER IF NOT EXISTS trg_Employees_VersionDelete
+    AFTER DELETE ON Employees
+    BEGIN
+        INSERT INTO Meta (key, val) VALUES ('employees_ver', 1)
+        ON CONFLICT(key) DO UPDATE SET val = val + 1;
+    END;
+    
+    ANALYZE;
+"""
 
 # Initialize database
 def init_db():
@@ -25,119 +151,421 @@ def init_db():
         print("Database created and seeded successfully!")
     else:
         print(f"Database already exists: {DB_PATH}")
+    
+    conn = sqlite3.connect(DB_PATH, isolation_level=None)
+    # Databases from an older schema.sql lack a STORED dateFoundJD column
+    # (hidden = 3 in table_xinfo), which ALTER TABLE cannot add
+    hidden = {row[1]: row[6] for row in conn.execute('PRAGMA table_xinfo(Items)')}
+    if hidden.get('dateFoundJD') != 3:
+        print("Upgrading Items table (dateFoundJD)")
+        rebuild_items_table(conn)
+    conn.executescript(SCHEMA_UPGRADES_SQL)
+    conn.close()
+
+def rebuild_items_table(conn):
+    """Recreate Items from its schema.sql definition, keeping rows, triggers, indexes and ids"""
+    with open('schema.sql', 'r') as f:
+        create_sql = re.search(r'CREATE TABLE IF NOT EXISTS Items \(.*?\n\);', f.read(), re.S).group(0)
+    create_sql = create_sql.replace('IF NOT EXISTS Items', 'Items_new', 1)
+    
+    # Copy only stored columns; generated ones are recomputed on insert.
+    # Copying rows fires no UPDATE, so trg_Item_BeforeUpdate leaves
+    # dateUpdated untouched.
+    columns = ', '.join(row[1] for row in conn.execute('PRAGMA table_xinfo(Items)') if row[6] == 0)
+    dependents = [row[0] for row in conn.execute("""
+        SELECT sql FROM sqlite_master
+        WHERE tbl_name = 'Items' AND type IN ('index', 'trigger') AND sql IS NOT NULL
+    """)]
+    seq = conn.execute("SELECT seq FROM sqlite_sequence WHERE name = 'Items'").fetchone()
+    
+    conn.execute('BEGIN')
+    try:
+        conn.execute(create_sql)
+        conn.execute(f'INSERT INTO Items_new ({columns}) SELECT {columns} FROM Items')
+        conn.execute('DROP TABLE Items')
+        conn.execute('ALTER TABLE Items_new RENAME TO Items')
+        for sql in dependents:
+            conn.execute(sql)
+        if seq:
+            conn.execute("UPDATE sqlite_sequence SET seq = ? WHERE name = 'Items'", seq)
+        conn.execute('COMMIT')
+    except Exception:
+        conn.execute('ROLLBACK')
+        raise
+
+def start_logging():
+    """Attach the queued stdout handler to the request logger"""
+    log_queue = queue.SimpleQueue()
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('[%(asctime)s] %(message)s', '%d/%b/%Y %H:%M:%S'))
+    listener = QueueListener(log_queue, handler)
+    logger.addHandler(QueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    listener.start()
+    return listener
+
+def julian_now():
+    """Current time as a Julian day number, matching SQLite's julianday('now')"""
+    return time.time() / 86400.0 + 2440587.5
+
+def load_static(filepath):
+    """Return the cached entry for a static file, re-reading it if it changed on disk"""
+    stat = os.stat(filepath)
+    entry = _STATIC.get(filepath)
+    if entry is None or entry[0] != stat.st_mtime:
+        with open(filepath, 'rb') as f:
+            content = f.read()
+        content_type = CONTENT_TYPES.get(os.path.splitext(filepath)[1])
+        etag = f'"{stat.st_mtime_ns:x}-{len(content):x}"'
+        entry = (stat.st_mtime, content_type, etag, content, gzip.compress(content, 9))
+        _STATIC[filepath] = entry
+    return entry
 
-def get_db():
-    """Get database connection"""
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
+def invalidate_metrics():
+    """Drop the cached metrics after a write to Items"""
+    _metrics_cache['gen'] += 1
+    _metrics_cache['ts'] = float('-inf')
+
+def accepts_gzip(accept_encoding):
+    """Whether an Accept-Encoding header allows gzip, honouring q-values
+
+    An explicit gzip (or x-gzip) entry decides; otherwise a '*' entry does.
+    """
+    wildcard = False
+    for entry in accept_encoding.split(','):
+        coding, _, params = entry.partition(';')
+        coding = coding.strip().lower()
+        q = 1.0
+        for param in params.split(';'):
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding in ('gzip', 'x-gzip'):
+            return q > 0
+        if coding == '*':
+            wildcard = q > 0
+    return wildcard
+
+def gzip_json(body):
+    """Gzipped copy of a JSON body, or None when it is too small to bother"""
+    if len(body) < GZIP_MIN_SIZE:
+        return None
+    return gzip.compress(body, GZIP_LEVEL)
+
+def dumps(data):
+    """Serialize data to JSON bytes (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(data, default=str)
+    return json.dumps(data, default=str).encode()
+
+def loads(body):
+    """Parse JSON from bytes or a memoryview (orjson when available)"""
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(bytes(body))
+
+class PoolTimeout(Exception):
+    """No pooled connection became free within POOL_TIMEOUT"""
+
+class ConnectionPool:
+    """Thread-safe pool of long-lived SQLite connections"""
+
+    def __init__(self, path, size=POOL_SIZE, timeout=POOL_TIMEOUT):
+        self.path = path
+        self.size = size
+        self.timeout = timeout
+        self._idle = queue.Queue(maxsize=size)
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        """Open a new pooled connection"""
+        conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        # sqlite3.connect's default 5s timeout already sets busy_timeout
+        conn.executescript(CONNECTION_PRAGMAS)
+        return conn
+
+    @contextmanager
+    def acquire(self):
+        """Borrow a connection, returning it to the pool on exit"""
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                grow = self._created < self.size
+                if grow:
+                    self._created += 1
+            if grow:
+                try:
+                    conn = self._connect()
+                except Exception:
+                    with self._lock:
+                        self._created -= 1
+                    raise
+            else:
+                try:
+                    conn = self._idle.get(timeout=self.timeout)
+                except queue.Empty:
+                    raise PoolTimeout('No database connection available') from None
+        try:
+            yield conn
+        finally:
+            # Never hand out a connection with a half-finished transaction
+            if conn.in_transaction:
+                conn.rollback()
+            self._idle.put(conn)
+
+# Connections are opened lazily so init_db() still sees a missing file
+pool = ConnectionPool(DB_PATH)
 
 class APIHandler(BaseHTTPRequestHandler):
     
+    # Socket timeout; a stalled client errors out instead of holding its
+    # pooled connection (and WAL read snapshot) indefinitely
+    timeout = REQUEST_TIMEOUT
+    
     def _send_cors_headers(self):
         """Send CORS headers"""
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+        for name, value in CORS_HEADERS:
+            self.send_header(name, value)
+    
+    def _accepts_gzip(self):
+        """Whether the client accepts gzip-encoded responses"""
+        return accepts_gzip(self.headers.get('Accept-Encoding', ''))
     
     def _send_json(self, data, status=200):
         """Send JSON response"""
-        self.send_response(status)
+        self._send_json_body(dumps(data), status)
+    
+    def _write_response(self, status, headers, body):
+        """Write status line, headers and body with a single socket write"""
+        self.log_request(status)
+        head = [
+            f'{self.protocol_version} {status} {self.responses[status][0]}',
+            f'Server: {self.version_string()}',
+            f'Date: {self.date_time_string()}',
+        ]
+        head.extend(f'{name}: {value}' for name, value in headers)
+        head.append('\r\n')
+        self.wfile.write(b''.join(('\r\n'.join(head).encode('latin-1'), body)))
+    
+    def _send_json_body(self, body, status=200, gzipped=None):
+        """Send an already-serialized JSON response
+
+        Cached responses pass their precompressed body as gzipped.
+        """
+        headers = [('Content-Type', 'application/json')]
+        if self._accepts_gzip():
+            if gzipped is None:
+                gzipped = gzip_json(body)
+            if gzipped is not None:
+                body = gzipped
+                headers.append(('Content-Encoding', 'gzip'))
+        headers.append(('Content-Length', len(body)))
+        headers.append(('Vary', 'Accept-Encoding'))
+        headers.extend(CORS_HEADERS)
+        self._write_response(status, headers, body)
+    
+    def _send_json_rows(self, cursor):
+        """Stream cursor rows as a JSON array without materializing the full list"""
+        # Plain tuples are cheaper than sqlite3.Row; the column names are
+        # taken once from the cursor description
+        cursor.row_factory = None
+        keys = [column[0] for column in cursor.description]
+        
+        # Pull the first batch before committing to a 200 so query errors
+        # can still be reported by the caller
+        rows = cursor.fetchmany(STREAM_BATCH_ROWS)
+        
+        # The final size is unknown up front, so compress whenever allowed
+        compressor = None
+        self.send_response(200)
         self.send_header('Content-Type', 'application/json')
+        if self._accepts_gzip():
+            compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Vary', 'Accept-Encoding')
         self._send_cors_headers()
         self.end_headers()
-        self.wfile.write(json.dumps(data).encode())
+        
+        def send(data):
+            if compressor is not None:
+                data = compressor.compress(data)
+            if data:
+                self.wfile.write(data)
+        
+        buf = bytearray(b'[')
+        try:
+            while rows:
+                # One dumps() per batch; strip the batch's own brackets
+                chunk = dumps([dict(zip(keys, row)) for row in rows])
+                buf += memoryview(chunk)[1:-1]
+                rows = cursor.fetchmany(STREAM_BATCH_ROWS)
+                if rows:
+                    buf += b','
+                if len(buf) >= STREAM_CHUNK_SIZE:
+                    send(buf)
+                    buf.clear()
+        except Exception as e:
+            # Headers are already out; all we can do is cut the response short
+            self.log_error('Aborted JSON stream: %s', e)
+            self.close_connection = True
+            return
+        buf += b']'
+        send(buf)
+        if compressor is not None:
+            self.wfile.write(compressor.flush())
     
     def _send_file(self, filepath):
-        """Send file response"""
+        """Send file response (served from the in-memory static cache)"""
         try:
-            with open(filepath, 'rb') as f:
-                content = f.read()
-            self.send_response(200)
-            if filepath.endswith('.html'):
-                self.send_header('Content-Type', 'text/html')
-            elif filepath.endswith('.css'):
-                self.send_header('Content-Type', 'text/css')
-            elif filepath.endswith('.js'):
-                self.send_header('Content-Type', 'application/javascript')
-            self.end_headers()
-            self.wfile.write(content)
+            _, content_type, etag, content, gzipped = load_static(filepath)
         except FileNotFoundError:
             self.send_error(404, 'File not found')
+            return
+        
+        encoded = self._accepts_gzip()
+        if encoded:
+            # Each encoding is a distinct representation with its own ETag
+            content = gzipped
+            etag = etag[:-1] + '-gzip"'
+        
+        # Sent on both 200 and 304 so caches keep the variants apart
+        cache_headers = [
+            ('Vary', 'Accept-Encoding'),
+            ('Cache-Control', 'public, max-age=300'),
+            ('ETag', etag),
+        ]
+        
+        if self.headers.get('If-None-Match') == etag:
+            self._write_response(304, cache_headers, b'')
+            return
+        
+        headers = []
+        if content_type:
+            headers.append(('Content-Type', content_type))
+        if encoded:
+            headers.append(('Content-Encoding', 'gzip'))
+        headers.append(('Content-Length', len(content)))
+        headers.extend(cache_headers)
+        self._write_response(200, headers, content)
     
     def do_OPTIONS(self):
-        """Handle preflight requests"""
-        self.send_response(200)
-        self._send_cors_headers()
-        self.end_headers()
+        """Handle preflight requests with the prebuilt response"""
+        self.log_request(200)
+        self.wfile.write(_PREFLIGHT)
     
     def do_GET(self):
         """Handle GET requests"""
         parsed = urlparse(self.path)
         path = parsed.path
         
-        # Serve static files
-        if path == '/' or path == '/ui.html':
-            self._send_file('ui.html')
+        # Static files and API endpoints, one dict lookup per request
+        handler = self.GET_ROUTES.get(path)
+        if handler is None:
+            self.send_error(404, 'Endpoint not found')
             return
+        handler(self)
+    
+    def _read_json_body(self, content_length):
+        """Read the request body into a pooled buffer and parse it in place"""
+        if content_length <= 0:
+            return {}
         
-        # API endpoints
-        if path == '/api/items':
-            self.get_items()
-        elif path == '/api/claims':
-            self.get_claims()
-        elif path == '/api/metrics':
-            self.get_metrics()
-        elif path == '/api/employees':
-            self.get_employees()
+        pooled = content_length <= BODY_BUFFER_SIZE
+        if pooled:
+            try:
+                buf = _body_buffers.get_nowait()
+            except queue.Empty:
+                buf = bytearray(BODY_BUFFER_SIZE)
         else:
-            self.send_error(404, 'Endpoint not found')
+            buf = bytearray(content_length)
+        
+        try:
+            with memoryview(buf) as view:
+                n = self.rfile.readinto(view[:content_length])
+                return loads(view[:n])
+        finally:
+            if pooled:
+                _body_buffers.put(buf)
     
     def do_POST(self):
         """Handle POST requests"""
         parsed = urlparse(self.path)
         path = parsed.path
         
-        # Read body
+        # Read body; ValueError also covers bad UTF-8
         content_length = int(self.headers.get('Content-Length', 0))
-        body = self.rfile.read(content_length).decode() if content_length > 0 else '{}'
-        
         try:
-            data = json.loads(body) if body else {}
-        except json.JSONDecodeError:
+            data = self._read_json_body(content_length)
+        except ValueError:
             self._send_json({'error': 'Invalid JSON'}, 400)
             return
         
-        if path == '/api/items':
-            self.add_item(data)
-        elif path.startswith('/api/claims/') and path.endswith('/approve'):
-            claim_id = path.split('/')[3]
-            self.approve_claim(claim_id)
-        else:
-            self.send_error(404, 'Endpoint not found')
+        handler = self.POST_ROUTES.get(path)
+        if handler is not None:
+            handler(self, data)
+            return
+        
+        # Parameterized routes pass their captured groups as arguments
+        for pattern, handler in self.POST_PATTERNS:
+            match = pattern.fullmatch(path)
+            if match:
+                handler(self, *match.groups())
+                return
+        
+        self.send_error(404, 'Endpoint not found')
+    
+    def get_ui(self):
+        """GET / - Serve the web UI"""
+        self._send_file('ui.html')
     
     def get_items(self):
-        """GET /api/items - Return all unclaimed items"""
+        """GET /api/items?since_id=&limit= - Return a page of unclaimed items, newest first"""
+        params = parse_qs(urlparse(self.path).query)
         try:
-            conn = get_db()
-            cursor = conn.execute("""
-                SELECT 
-                    id as itemID,
-                    name as itemName,
-                    description as itemDescription,
-                    category as itemCategory,
-                    color,
-                    dateFound,
-                    foundAt as FoundAt,
-                    isClaimed,
-                    CAST((julianday('now') - julianday(dateFound)) as INTEGER) as DaysUnclaimed
-                FROM Items
-                WHERE isClaimed = 0
-                ORDER BY dateFound DESC
-            """)
-            items = [dict(row) for row in cursor.fetchall()]
-            conn.close()
-            self._send_json(items)
+            since_id = int(params['since_id'][0]) if 'since_id' in params else MAX_ROWID
+            limit = int(params['limit'][0]) if 'limit' in params else ITEMS_PAGE_SIZE
+        except ValueError:
+            self._send_json({'error': 'since_id and limit must be integers'}, 400)
+            return
+        # Clamp both into SQLite's 64-bit INTEGER range before binding
+        since_id = max(0, min(since_id, MAX_ROWID))
+        limit = max(1, min(limit, ITEMS_PAGE_MAX))
+        
+        try:
+            with pool.acquire() as conn:
+                # Keyset pagination: one extra row tells us whether a next page exists
+                cursor = conn.execute("""
+                    SELECT 
+                        id as itemID,
+                        name as itemName,
+                        description as itemDescription,
+                        category as itemCategory,
+                        color,
+                        dateFound,
+                        foundAt as FoundAt,
+                        isClaimed,
+                        CAST((? - dateFoundJD) as INTEGER) as DaysUnclaimed
+                    FROM Items
+                    WHERE isClaimed = 0 AND id < ?
+                    ORDER BY id DESC
+                    LIMIT ?
+                """, (julian_now(), since_id, limit + 1))
+                items = [dict(row) for row in cursor.fetchall()]
+            
+            next_since_id = None
+            if len(items) > limit:
+                del items[limit:]
+                next_since_id = items[-1]['itemID']
+            self._send_json({'items': items, 'next_since_id': next_since_id})
+        except PoolTimeout as e:
+            self._send_json({'error': str(e)}, 503)
         except Exception as e:
             self._send_json({'error': str(e)}, 500)
     
@@ -149,128 +577,120 @@ class APIHandler(BaseHTTPRequestHandler):
                 self._send_json({'error': 'Missing required fields'}, 400)
                 return
             
-            conn = get_db()
-            cursor = conn.execute("""
-                INSERT INTO Items (name, category, description, color, dateFound, foundAt, isClaimed, dateUpdated)
-                VALUES (?, ?, ?, ?, ?, ?, 0, datetime('now'))
-            """, (data['itemName'], data['itemCategory'], data['itemDescription'], 
-                  data['color'], data['dateFound'], data['FoundAt']))
-            
-            item_id = cursor.lastrowid
-            conn.commit()
-            
-            # Return created item
-            cursor = conn.execute("""
-                SELECT id as itemID, name as itemName, category as itemCategory, 
-                       description as itemDescription, color, dateFound, foundAt as FoundAt
-                FROM Items WHERE id = ?
-            """, (item_id,))
-            item = dict(cursor.fetchone())
-            conn.close()
+            with pool.acquire() as conn:
+                # Shape the created item straight from the INSERT (SQLite 3.35+)
+                cursor = conn.execute("""
+                    INSERT INTO Items (name, category, description, color, dateFound, foundAt, isClaimed, dateUpdated)
+                    VALUES (?, ?, ?, ?, ?, ?, 0, datetime('now'))
+                    RETURNING id as itemID, name as itemName, category as itemCategory, 
+                              description as itemDescription, color, dateFound, foundAt as FoundAt
+                """, (data['itemName'], data['itemCategory'], data['itemDescription'], 
+                      data['color'], data['dateFound'], data['FoundAt']))
+                item = dict(cursor.fetchone())
+            invalidate_metrics()
             
             self._send_json(item, 201)
+        except PoolTimeout as e:
+            self._send_json({'error': str(e)}, 503)
         except Exception as e:
             self._send_json({'error': str(e)}, 500)
     
     def get_claims(self):
         """GET /api/claims - Return pending claims"""
         try:
-            conn = get_db()
-            cursor = conn.execute("""
-                SELECT 
-                    c.id as claimID,
-                    c.claimDate,
-                    c.verificationCode,
-                    c.ownerFirstName as OwnerFirstName,
-                    c.ownerLastName as OwnerLastName,
-                    i.name as itemName,
-                    i.category as itemCategory,
-                    i.foundAt as FoundAtLocation,
-                    COALESCE(e.firstName || ' ' || e.lastName, 'Unassigned') as ManagingStaff
-                FROM Claims c
-                JOIN Items i ON c.itemID = i.id
-                LEFT JOIN Employees e ON c.handledBy = e.id
-                WHERE c.verificationStatus = 'Pending'
-            """)
-            claims = [dict(row) for row in cursor.fetchall()]
-            conn.close()
-            self._send_json(claims)
+            with pool.acquire() as conn:
+                cursor = conn.execute("""
+                    SELECT 
+                        c.id as claimID,
+                        c.claimDate,
+                        c.verificationCode,
+                        c.ownerFirstName as OwnerFirstName,
+                        c.ownerLastName as OwnerLastName,
+                        i.name as itemName,
+                        i.category as itemCategory,
+                        i.foundAt as FoundAtLocation,
+                        COALESCE(e.firstName || ' ' || e.lastName, 'Unassigned') as ManagingStaff
+                    FROM Claims c
+                    JOIN Items i ON c.itemID = i.id
+                    LEFT JOIN Employees e ON c.handledBy = e.id
+                    WHERE c.verificationStatus = 'Pending'
+                """)
+                self._send_json_rows(cursor)
+        except PoolTimeout as e:
+            self._send_json({'error': str(e)}, 503)
         except Exception as e:
             self._send_json({'error': str(e)}, 500)
     
     def approve_claim(self, claim_id):
         """POST /api/claims/:id/approve - Approve a claim (Transaction)"""
         try:
-            conn = get_db()
-            
-            # Begin transaction
-            conn.execute('BEGIN TRANSACTION')
-            
-            # Get claim and item ID
-            cursor = conn.execute("""
-                SELECT itemID FROM Claims 
-                WHERE id = ? AND verificationStatus = 'Pending'
-            """, (claim_id,))
-            row = cursor.fetchone()
-            
-            if not row:
-                conn.rollback()
-                self._send_json({'error': 'Claim not found or already processed'}, 404)
-                return
-            
-            item_id = row['itemID']
-            
-            # Update claim status
-            conn.execute("""
-                UPDATE Claims 
-                SET verificationStatus = 'Approved' 
-                WHERE id = ?
-            """, (claim_id,))
-            
-            # Update item (triggers trg_Item_BeforeUpdate)
-            conn.execute("""
-                UPDATE Items 
-                SET isClaimed = 1, dateUpdated = datetime('now')
-                WHERE id = ?
-            """, (item_id,))
-            
-            # Insert status history
-            conn.execute("""
-                INSERT INTO ItemStatus (itemID, status, statusDate)
-                VALUES (?, 'Claimed', datetime('now'))
-            """, (item_id,))
-            
-            # Commit transaction
-            conn.commit()
-            conn.close()
+            # The pool rolls back any transaction left open on release
+            with pool.acquire() as conn:
+                # Begin transaction
+                conn.execute('BEGIN TRANSACTION')
+                
+                # Approve the claim, returning its item ID (SQLite 3.35+).
+                # No row back means the claim is missing or already processed.
+                row = conn.execute("""
+                    UPDATE Claims 
+                    SET verificationStatus = 'Approved' 
+                    WHERE id = ? AND verificationStatus = 'Pending'
+                    RETURNING itemID
+                """, (claim_id,)).fetchone()
+                
+                if not row:
+                    conn.rollback()
+                    self._send_json({'error': 'Claim not found or already processed'}, 404)
+                    return
+                
+                item_id = row['itemID']
+                
+                # Update item (triggers trg_Item_BeforeUpdate)
+                conn.execute("""
+                    UPDATE Items 
+                    SET isClaimed = 1, dateUpdated = datetime('now')
+                    WHERE id = ?
+                """, (item_id,))
+                
+                # Insert status history
+                conn.execute("""
+                    INSERT INTO ItemStatus (itemID, status, statusDate)
+                    VALUES (?, 'Claimed', datetime('now'))
+                """, (item_id,))
+                
+                # Commit transaction
+                conn.commit()
+            invalidate_metrics()
             
             self._send_json({'success': True, 'claimID': claim_id, 'itemID': item_id})
+        except PoolTimeout as e:
+            self._send_json({'error': str(e)}, 503)
         except Exception as e:
-            if conn:
-                conn.rollback()
             self._send_json({'error': str(e)}, 500)
     
     def get_metrics(self):
-        """GET /api/metrics - Return dashboard metrics"""
+        """GET /api/metrics - Return dashboard metrics (cached for _METRICS_TTL seconds)"""
+        if time.monotonic() - _metrics_cache['ts'] < _METRICS_TTL:
+            self._send_json_body(_metrics_cache['body'], gzipped=_metrics_cache['gzip'])
+            return
+        
         try:
-            conn = get_db()
-            
-            # Unclaimed stats
-            cursor = conn.execute("""
-                SELECT 
-                    COUNT(*) as totalUnclaimed,
-                    AVG(julianday('now') - julianday(dateFound)) as avgDays
-                FROM Items WHERE isClaimed = 0
-            """)
-            unclaimed = cursor.fetchone()
-            
-            # Claimed stats
-            cursor = conn.execute("""
-                SELECT COUNT(*) as totalClaimed FROM Items WHERE isClaimed = 1
-            """)
-            claimed = cursor.fetchone()
-            
-            conn.close()
+            gen = _metrics_cache['gen']
+            with pool.acquire() as conn:
+                # Unclaimed stats
+                cursor = conn.execute("""
+                    SELECT 
+                        COUNT(*) as totalUnclaimed,
+                        ? - AVG(dateFoundJD) as avgDays
+                    FROM Items WHERE isClaimed = 0
+                """, (julian_now(),))
+                unclaimed = cursor.fetchone()
+                
+                # Claimed stats
+                cursor = conn.execute("""
+                    SELECT COUNT(*) as totalClaimed FROM Items WHERE isClaimed = 1
+                """)
+                claimed = cursor.fetchone()
             
             metrics = [
                 {
@@ -285,41 +705,88 @@ class APIHandler(BaseHTTPRequestHandler):
                 }
             ]
             
-            self._send_json(metrics)
+            body = dumps(metrics)
+            gzipped = gzip_json(body)
+            # Skip caching if a write invalidated the metrics mid-query
+            if _metrics_cache['gen'] == gen:
+                _metrics_cache.update(ts=time.monotonic(), body=body, gzip=gzipped)
+            self._send_json_body(body, gzipped=gzipped)
+        except PoolTimeout as e:
+            self._send_json({'error': str(e)}, 503)
         except Exception as e:
             self._send_json({'error': str(e)}, 500)
     
     def get_employees(self):
-        """GET /api/employees - Return employee performance"""
+        """GET /api/employees - Return employee performance (cached per Employees version)"""
         try:
-            conn = get_db()
-            cursor = conn.execute("""
-                SELECT 
-                    id as employeeID,
-                    firstName,
-                    lastName,
-                    position,
-                    itemsManaged as ItemsManaged
-                FROM Employees
-                ORDER BY itemsManaged DESC
-            """)
-            employees = [dict(row) for row in cursor.fetchall()]
-            conn.close()
-            self._send_json(employees)
+            with pool.acquire() as conn:
+                # Read the version before the rows: a concurrent write then
+                # leaves the cache keyed to an old version, never a new one
+                row = conn.execute("SELECT val FROM Meta WHERE key = 'employees_ver'").fetchone()
+                ver = row['val'] if row else 0
+                if ver == _employees_cache['ver']:
+                    body, gzipped = _employees_cache['body'], _employees_cache['gzip']
+                else:
+                    cursor = conn.execute("""
+                        SELECT 
+                            id as employeeID,
+                            firstName,
+                            lastName,
+                            position,
+                            itemsManaged as ItemsManaged
+                        FROM Employees
+                        ORDER BY itemsManaged DESC
+                    """)
+                    body = dumps([dict(row) for row in cursor.fetchall()])
+                    gzipped = gzip_json(body)
+                    _employees_cache.update(ver=ver, body=body, gzip=gzipped)
+            self._send_json_body(body, gzipped=gzipped)
+        except PoolTimeout as e:
+            self._send_json({'error': str(e)}, 503)
         except Exception as e:
             self._send_json({'error': str(e)}, 500)
     
     def log_message(self, format, *args):
-        """Custom logging"""
-        print(f"[{self.log_date_time_string()}] {format % args}")
+        """Custom logging (formatting is deferred to the logger)"""
+        logger.info(format, *args)
+    
+    # GET dispatch table: exact path -> handler
+    GET_ROUTES = {
+        '/': get_ui,
+        '/ui.html': get_ui,
+        '/api/items': get_items,
+        '/api/claims': get_claims,
+        '/api/metrics': get_metrics,
+        '/api/employees': get_employees,
+    }
+    
+    # POST dispatch: exact path -> handler(data), then pattern -> handler(*groups)
+    POST_ROUTES = {
+        '/api/items': add_item,
+    }
+    POST_PATTERNS = [
+        (re.compile(r'/api/claims/(\d+)/approve'), approve_claim),
+    ]
 
 def main():
+    # Python may be linked against an older SQLite than the queries need
+    if sqlite3.sqlite_version_info < MIN_SQLITE_VERSION:
+        required = '.'.join(map(str, MIN_SQLITE_VERSION))
+        sys.exit(f"SQLite {required} or newer is required (this Python uses {sqlite3.sqlite_version})")
+    
     # Initialize database
     init_db()
+    listener = start_logging()
+    
+    # Warm the static file cache
+    for filepath in STATIC_FILES:
+        if os.path.exists(filepath):
+            load_static(filepath)
     
     # Start server
     PORT = 8000
-    server = HTTPServer(('localhost', PORT), APIHandler)
+    # One thread per request; handlers share the connection pool
+    server = ThreadingHTTPServer(('localhost', PORT), APIHandler)
     print(f"\n Server running at http://localhost:{PORT}")
     print(f" Open UI at: http://localhost:{PORT}/ui.html")
     print(f" Database: {DB_PATH}")
@@ -330,6 +797,7 @@ def main():
     except KeyboardInterrupt:
         print("\n\n Server stopped")
         server.shutdown()
+        listener.stop()
 
 if __name__ == '__main__':
     main()